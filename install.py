@@ -15,91 +15,204 @@ https://github.com/sdiehl/universal-mcp-installer
 """
 
 import argparse
+import copy
+import functools
 import json
+import math
 import os
-import platform
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
 
 # XXX: Change these to match your server
 SERVER_NAME = "usolver"
 SERVER_EXECUTABLE = "usolver_mcp/server/main.py"
 
-
+_HOME = str(Path.home())
+
+# Accepted answers to the confirmation prompt
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+
+
+# Config file locations per OS, as (client, base directory, path components)
+_PATHS_DARWIN = (
+    (
+        "claude",
+        "home",
+        ("Library", "Application Support", "Claude", "claude_desktop_config.json"),
+    ),
+    ("cursor", "home", (".cursor", "mcp.json")),
+    ("vscode", "home", (".vscode", "mcp.json")),
+    ("cline", "home", (".cline", "mcp.json")),
+    ("windsurf", "home", (".codeium", "windsurf", "mcp_config.json")),
+    ("n8n", "home", (".n8n", "mcp.json")),
+    ("5ire", "home", ("Library", "Application Support", "5ire", "mcp.json")),
+)
+
+_PATHS_WINDOWS = (
+    ("claude", "appdata", ("Claude", "claude_desktop_config.json")),
+    ("cursor", "home", (".cursor", "mcp.json")),
+    ("vscode", "home", (".vscode", "mcp.json")),
+    ("cline", "home", (".cline", "mcp.json")),
+    ("windsurf", "localappdata", ("Codeium", "Windsurf", "mcp_config.json")),
+    ("n8n", "home", (".n8n", "mcp.json")),
+    ("5ire", "appdata", ("5ire", "mcp.json")),
+)
+
+_PATHS_LINUX = (
+    ("claude", "home", (".config", "Claude", "claude_desktop_config.json")),
+    ("cursor", "home", (".cursor", "mcp.json")),
+    ("vscode", "home", (".vscode", "mcp.json")),
+    ("cline", "home", (".cline", "mcp.json")),
+    ("windsurf", "home", (".config", "windsurf", "mcp_config.json")),
+    ("n8n", "home", (".n8n", "mcp.json")),
+    ("5ire", "home", (".config", "5ire", "mcp.json")),
+)
+
+
+@functools.lru_cache(maxsize=1)
 def get_config_paths() -> Dict[str, Path]:
     """Get the config file paths for all supported MCP clients"""
-    system = platform.system()
-    home = Path.home()
-
-    config_paths = {}
-
-    if system == "Darwin":  # macOS
-        config_paths.update(
-            {
-                "claude": home
-                / "Library/Application Support/Claude/claude_desktop_config.json",
-                "cursor": home / ".cursor/mcp.json",
-                "vscode": home / ".vscode/mcp.json",
-                "cline": home / ".cline/mcp.json",
-                "windsurf": home / ".codeium/windsurf/mcp_config.json",
-                "n8n": home / ".n8n/mcp.json",
-                "5ire": home / "Library/Application Support/5ire/mcp.json",
-            }
-        )
-    elif system == "Windows":
-        appdata = os.environ.get("APPDATA", "")
-        localappdata = os.environ.get("LOCALAPPDATA", "")
-        config_paths.update(
-            {
-                "claude": Path(appdata) / "Claude/claude_desktop_config.json",
-                "cursor": home / ".cursor/mcp.json",
-                "vscode": home / ".vscode/mcp.json",
-                "cline": home / ".cline/mcp.json",
-                "windsurf": Path(localappdata) / "Codeium/Windsurf/mcp_config.json",
-                "n8n": home / ".n8n/mcp.json",
-                "5ire": Path(appdata) / "5ire/mcp.json",
-            }
-        )
+    if sys.platform == "darwin":  # macOS
+        table = _PATHS_DARWIN
+    elif sys.platform.startswith("win"):
+        table = _PATHS_WINDOWS
     else:  # Linux and others
-        config_paths.update(
-            {
-                "claude": home / ".config/Claude/claude_desktop_config.json",
-                "cursor": home / ".cursor/mcp.json",
-                "vscode": home / ".vscode/mcp.json",
-                "cline": home / ".cline/mcp.json",
-                "windsurf": home / ".config/windsurf/mcp_config.json",
-                "n8n": home / ".n8n/mcp.json",
-                "5ire": home / ".config/5ire/mcp.json",
-            }
-        )
+        table = _PATHS_LINUX
 
-    return config_paths
+    bases = {
+        "home": _HOME,
+        "appdata": os.environ.get("APPDATA", ""),
+        "localappdata": os.environ.get("LOCALAPPDATA", ""),
+    }
+    return {
+        name: Path(os.path.join(bases[base], *parts)) for name, base, parts in table
+    }
 
 
-def load_or_create_config(
-    config_path: Path, default_structure: Dict[str, Any] | None = None
-) -> Dict[str, Any]:
-    """Load existing config or create a new one with specified default structure"""
-    if config_path.exists():
+@functools.lru_cache(maxsize=64)
+def _dir_exists(path: str) -> bool:
+    """Check whether a directory exists, caching the result per path"""
+    return Path(path).is_dir()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON with orjson when available, falling back to the stdlib parser"""
+    if orjson is not None:
         try:
-            with open(config_path) as f:
-                return json.load(f)
-        except (OSError, json.JSONDecodeError):
-            print(f"Warning: Could not read {config_path}, creating new config")
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, integers wider than 64 bits and
+            # lone surrogates, which the stdlib parser accepts
+            pass
+    return json.loads(data)
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Check for NaN/Infinity values, which orjson would write as null"""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def _json_dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serialize JSON with orjson when available, else the stdlib
+
+    Output is compact unless ``pretty`` is set, in which case it is indented.
+    """
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits or strings with lone surrogates
+            pass
+    if pretty:
+        options: Dict[str, Any] = {"indent": 2}
+    else:
+        options = {"separators": (",", ":")}
+    try:
+        # Write non-ASCII text as raw UTF-8, as orjson does
+        return json.dumps(data, ensure_ascii=False, **options).encode()
+    except UnicodeEncodeError:
+        # Lone surrogates can only be written as \uXXXX escapes
+        return json.dumps(data, **options).encode()
 
-    return default_structure or {"mcpServers": {}}
 
+@functools.lru_cache(maxsize=16)
+def _read_config(path: str, mtime_ns: int, size: int) -> Tuple[bytes, Any]:
+    """Read and parse a config file, cached on its path, mtime and size"""
+    data = Path(path).read_bytes()
+    return data, _json_loads(data)
 
-def save_config(config_path: Path, config_data: Dict[str, Any]) -> None:
-    """Save config to file, creating directories if needed"""
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(config_path, "w") as f:
-        json.dump(config_data, f, indent=2)
+
+def load_or_create_config(
+    config_path: Path,
+    default_structure: Dict[str, Any] | None = None,
+    warnings: List[str] | None = None,
+) -> Tuple[Dict[str, Any], bytes | None]:
+    """Load existing config or create a new one with specified default structure
+
+    Also returns the file's raw contents (None if it couldn't be loaded), so
+    callers can tell whether saving the config would change anything. Warnings
+    are appended to ``warnings`` if given, otherwise printed.
+    """
+    try:
+        stat = config_path.stat()
+        data, config = _read_config(str(config_path), stat.st_mtime_ns, stat.st_size)
+        # Callers mutate the config, so never hand out the cached object
+        return copy.deepcopy(config), data
+    except FileNotFoundError:
+        pass
+    except (OSError, json.JSONDecodeError):
+        warning = f"Warning: Could not read {config_path}, creating new config"
+        if warnings is None:
+            print(warning)
+        else:
+            warnings.append(warning)
+
+    return default_structure or {"mcpServers": {}}, None
+
+
+def save_config(
+    config_path: Path,
+    config_data: Dict[str, Any],
+    pretty: bool = False,
+    current: bytes | None = None,
+) -> bool:
+    """Save config to file, creating directories if they don't exist yet
+
+    Output is compact unless ``pretty`` is set, in which case it is indented.
+    Returns False without writing if ``current``, the file's existing contents,
+    already matches the serialized config.
+    """
+    data = _json_dumps(config_data, pretty)
+    if data == current:
+        return False
+
+    parent = config_path.parent
+    if not _dir_exists(str(parent)):
+        parent.mkdir(parents=True, exist_ok=True)
+        # The directory (and possibly its parents) now exists
+        _dir_exists.cache_clear()
+    with open(config_path, "wb") as f:
+        f.write(data)
+    return True
 
 
+@functools.lru_cache(maxsize=1)
 def get_uv_command() -> str:
-    """Get the uv command path"""
+    """Get the uv command path (probed once per process)"""
     possible_paths = [
         "/opt/homebrew/bin/uv",  # Homebrew on macOS
         "/usr/local/bin/uv",  # Manual install
@@ -113,119 +226,113 @@ def get_uv_command() -> str:
     return "uv"  # Fallback
 
 
-def install_to_claude_cursor_format(
-    config_path: Path, script_dir: Path, server_name: str
-) -> bool:
-    """Install MCP server configuration to Claude Desktop/Cursor format"""
-    config = load_or_create_config(config_path)
-
-    if "mcpServers" not in config:
-        config["mcpServers"] = {}
-
-    # Build server configuration
-    server_config = {
-        "command": get_uv_command(),
-        "args": [
-            "run",
-            "--directory",
-            str(script_dir),
-            SERVER_EXECUTABLE,
-        ],
-    }
+@functools.lru_cache(maxsize=4)
+def _uv_args(script_dir: str) -> Tuple[str, ...]:
+    """Get the uv arguments that launch the server from the given directory"""
+    return ("run", "--directory", script_dir, SERVER_EXECUTABLE)
 
-    # Add our server configuration
-    config["mcpServers"][server_name] = server_config
 
-    save_config(config_path, config)
-    return True
+class _ClientSchema(NamedTuple):
+    """Layout of an MCP client's config file"""
 
+    key: str  # Top-level key holding the server entries
+    container: str  # "dict" keyed by server name, or "list" of named entries
+    extra_fields: Dict[str, Any]  # Extra fields for our server entry
+    default_structure: Dict[str, Any]  # Config to start from if there is none
+    skip_if_missing: bool  # Skip the client if its config directory is missing
 
-def install_to_vscode_format(
-    config_path: Path, script_dir: Path, server_name: str
-) -> bool:
-    """Install MCP server configuration to VSCode format"""
-    default_structure: Dict[str, Any] = {"inputs": [], "servers": {}}
-
-    config = load_or_create_config(config_path, default_structure)
-
-    if "servers" not in config:
-        config["servers"] = {}
-
-    # Build server configuration for VSCode
-    server_config = {
-        "type": "stdio",
-        "command": get_uv_command(),
-        "args": [
-            "run",
-            "--directory",
-            str(script_dir),
-            SERVER_EXECUTABLE,
-        ],
-    }
-
-    # Add our server configuration
-    config["servers"][server_name] = server_config
 
-    save_config(config_path, config)
-    return True
+_CLIENT_SCHEMAS: Dict[str, _ClientSchema] = {
+    "claude": _ClientSchema("mcpServers", "dict", {}, {"mcpServers": {}}, False),
+    "cursor": _ClientSchema("mcpServers", "dict", {}, {"mcpServers": {}}, True),
+    "vscode": _ClientSchema(
+        "servers", "dict", {"type": "stdio"}, {"inputs": [], "servers": {}}, False
+    ),
+    "cline": _ClientSchema("mcpServers", "dict", {}, {"mcpServers": {}}, True),
+    "windsurf": _ClientSchema("servers", "list", {}, {"servers": []}, False),
+    "n8n": _ClientSchema("mcpServers", "dict", {}, {"mcpServers": {}}, True),
+    "5ire": _ClientSchema("mcpServers", "dict", {}, {"mcpServers": {}}, True),
+}
 
 
-def install_to_windsurf_format(
-    config_path: Path, script_dir: Path, server_name: str
+def install_to_format(
+    config_path: Path,
+    script_dir: Path,
+    server_name: str,
+    schema: _ClientSchema,
+    pretty: bool = False,
+    warnings: List[str] | None = None,
 ) -> bool:
-    """Install MCP server configuration to Windsurf format"""
-    default_structure: Dict[str, Any] = {"servers": []}
-
-    config = load_or_create_config(config_path, default_structure)
-
-    if "servers" not in config:
-        config["servers"] = []
-
-    # Build server configuration for Windsurf
-    server_config = {
-        "name": server_name,
-        "command": get_uv_command(),
-        "args": [
-            "run",
-            "--directory",
-            str(script_dir),
-            SERVER_EXECUTABLE,
-        ],
-    }
+    """Install MCP server configuration using a client's config schema
 
-    # Check if server already exists and update it, otherwise add new
-    existing_server = None
-    for i, server in enumerate(config["servers"]):
-        if server.get("name") == server_name:
-            existing_server = i
-            break
+    Returns False if the config file was already up to date and left untouched.
+    """
+    config, current = load_or_create_config(
+        config_path, copy.deepcopy(schema.default_structure), warnings
+    )
 
-    if existing_server is not None:
-        config["servers"][existing_server] = server_config
+    if schema.key not in config:
+        config[schema.key] = [] if schema.container == "list" else {}
+
+    # Build server configuration, list entries carry their own name
+    server_config: Dict[str, Any] = {}
+    if schema.container == "list":
+        server_config["name"] = server_name
+    server_config.update(schema.extra_fields)
+    server_config["command"] = get_uv_command()
+    server_config["args"] = list(_uv_args(str(script_dir)))
+
+    servers = config[schema.key]
+    if schema.container == "list":
+        # Check if server already exists and update it, otherwise add new
+        server_index: Dict[str, int] = {}
+        for i, server in enumerate(servers):
+            if isinstance(server, dict):
+                server_index.setdefault(server.get("name"), i)
+        existing_server = server_index.get(server_name)
+
+        if existing_server is not None:
+            servers[existing_server] = server_config
+        else:
+            servers.append(server_config)
     else:
-        config["servers"].append(server_config)
+        servers[server_name] = server_config
 
-    save_config(config_path, config)
-    return True
+    return save_config(config_path, config, pretty, current)
 
 
 def install_to_client(
-    client_name: str, config_path: Path, script_dir: Path, server_name: str
-) -> Tuple[bool, str]:
-    """Install to a specific client based on its format"""
+    client_name: str,
+    config_path: Path,
+    script_dir: Path,
+    server_name: str,
+    pretty: bool = False,
+) -> Tuple[bool, bool, str]:
+    """Install to a specific client based on its format
+
+    Returns (success, changed, message), where changed is False if the client's
+    config was already up to date. Any warnings raised while installing are
+    included in the message rather than printed, so callers control ordering.
+    """
+    schema = _CLIENT_SCHEMAS.get(client_name)
+    if schema is None:
+        return False, False, f"Unknown client format: {client_name}"
+
+    warnings: List[str] = []
     try:
-        if client_name in ["claude", "cursor", "cline", "n8n", "5ire"]:
-            install_to_claude_cursor_format(config_path, script_dir, server_name)
-        elif client_name == "vscode":
-            install_to_vscode_format(config_path, script_dir, server_name)
-        elif client_name == "windsurf":
-            install_to_windsurf_format(config_path, script_dir, server_name)
+        changed = install_to_format(
+            config_path, script_dir, server_name, schema, pretty, warnings
+        )
+        success = True
+        if changed:
+            message = f"✓ Installed to {client_name.title()}: {config_path}"
         else:
-            return False, f"Unknown client format: {client_name}"
-
-        return True, f"✓ Installed to {client_name.title()}: {config_path}"
+            message = f"✓ Already installed to {client_name.title()}: {config_path}"
     except Exception as e:
-        return False, f"✗ Failed to install to {client_name.title()}: {e}"
+        success, changed = False, False
+        message = f"✗ Failed to install to {client_name.title()}: {e}"
+
+    return success, changed, "\n".join([*warnings, message])
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -248,13 +355,14 @@ Examples:
   %(prog)s --clients claude cursor   # Install only to Claude Desktop and Cursor
   %(prog)s --server-name my-server   # Override the server name
   %(prog)s --yes                     # Skip confirmation prompt
+  %(prog)s --pretty                  # Write indented config files
         """,
     )
 
     parser.add_argument(
         "--clients",
         nargs="+",
-        choices=["claude", "cursor", "vscode", "cline", "windsurf", "n8n", "5ire"],
+        choices=list(_CLIENT_SCHEMAS),
         help="Specify which clients to install to (default: all available)",
     )
 
@@ -271,6 +379,12 @@ Examples:
         help="Skip confirmation prompt and proceed with installation",
     )
 
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Write indented, human-readable JSON config files (default: compact)",
+    )
+
     parser.add_argument(
         "--list-clients",
         action="store_true",
@@ -280,15 +394,16 @@ Examples:
     return parser.parse_args()
 
 
-def list_clients() -> None:
+def list_clients(config_paths: Dict[str, Path] | None = None) -> None:
     """List all supported clients and their configuration paths"""
-    config_paths = get_config_paths()
+    if config_paths is None:
+        config_paths = get_config_paths()
 
     print("Supported MCP Clients and Configuration Paths:")
     print("=" * 50)
 
     for client_name, config_path in config_paths.items():
-        status = "✓" if config_path.parent.exists() else "✗"
+        status = "✓" if _dir_exists(str(config_path.parent)) else "✗"
         print(f"{status} {client_name.ljust(10)} - {config_path}")
 
     print()
@@ -299,47 +414,52 @@ def list_clients() -> None:
 def main() -> None:
     """Install MCP server to local configurations"""
     args = parse_arguments()
+    config_paths = get_config_paths()
 
     # Handle list clients option
     if args.list_clients:
-        list_clients()
+        list_clients(config_paths)
         return
 
     script_dir = Path(__file__).parent.absolute()
     server_name = args.server_name
 
-    print("MCP Server Installer")
-    print("======================")
-    print()
-    print("This will install the MCP server to your local client configurations.")
-    print(f"Installation directory: {script_dir}")
-    print(f"Server name: {server_name}")
-    print(f"Server executable: {SERVER_EXECUTABLE}")
+    # Collect the banner and write it in one go before prompting
+    out = [
+        "MCP Server Installer",
+        "======================",
+        "",
+        "This will install the MCP server to your local client configurations.",
+        f"Installation directory: {script_dir}",
+        f"Server name: {server_name}",
+        f"Server executable: {SERVER_EXECUTABLE}",
+    ]
 
     # Show which clients will be targeted
-    config_paths = get_config_paths()
     if args.clients:
         target_clients = {
             name: path for name, path in config_paths.items() if name in args.clients
         }
-        print(f"Target clients: {', '.join(args.clients)}")
+        out.append(f"Target clients: {', '.join(args.clients)}")
     else:
         target_clients = config_paths
-        print("Target clients: all available")
+        out.append("Target clients: all available")
 
-    print()
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
 
     # Ask for confirmation unless --yes is specified
     if not args.yes:
         while True:
             response = (
                 input("Do you want to proceed with the installation? (y/n): ")
-                .lower()
                 .strip()
+                .lower()
             )
-            if response in ["y", "yes"]:
+            if response in _YES:
                 break
-            elif response in ["n", "no"]:
+            elif response in _NO:
                 print("Installation cancelled.")
                 sys.exit(0)
             else:
@@ -347,38 +467,60 @@ def main() -> None:
         print()
 
     installed_to = []
+    up_to_date = []
+
+    # Install to each target client; every client writes its own file, so the
+    # installs run concurrently and results are reported in client order
+    workers = max(1, min(8, len(target_clients)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = []
+        for client_name, config_path in target_clients.items():
+            # Skip clients where the parent directory doesn't exist (except for new installations)
+            schema = _CLIENT_SCHEMAS[client_name]
+            if schema.skip_if_missing and not _dir_exists(str(config_path.parent)):
+                pending.append((client_name, None))
+                continue
+
+            future = executor.submit(
+                install_to_client,
+                client_name,
+                config_path,
+                script_dir,
+                server_name,
+                args.pretty,
+            )
+            pending.append((client_name, future))
 
-    # Install to each target client
-    for client_name, config_path in target_clients.items():
-        # Skip clients where the parent directory doesn't exist (except for new installations)
-        if (
-            client_name in ["cursor", "cline", "n8n", "5ire"]
-            and not config_path.parent.exists()
-        ):
+    for client_name, future in pending:
+        if future is None:
             print(f"• {client_name.title()} config directory not found, skipping")
             continue
 
-        success, message = install_to_client(
-            client_name, config_path, script_dir, server_name
-        )
+        success, changed, message = future.result()
         print(message)
 
-        if success:
+        if success and changed:
             installed_to.append(client_name.title())
+        elif success:
+            up_to_date.append(client_name.title())
 
     print()
+    if not installed_to and not up_to_date:
+        print("Installation failed - no configurations were updated.")
+        sys.exit(1)
+
+    print("Installation completed successfully!")
     if installed_to:
-        print("Installation completed successfully!")
         print(f"Installed to: {', '.join(installed_to)}")
+    if up_to_date:
+        print(f"Already up to date: {', '.join(up_to_date)}")
+    if installed_to:
         print()
         print("Please restart your client(s) to use the MCP server.")
         print()
         print("Note: Some clients may require additional setup:")
         print("- VSCode: Make sure the MCP extension is installed")
         print("- Windsurf: Restart the application to load the new configuration")
-    else:
-        print("Installation failed - no configurations were updated.")
-        sys.exit(1)
 
 
 if __name__ == "__main__":